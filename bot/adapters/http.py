@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_session(pool_connections: int = 8, pool_maxsize: int = 32) -> requests.Session:
+    # Keep-Alive pool shared by every call an adapter makes, so repeated
+    # geocode/forecast/Gamma requests skip the TCP+TLS handshake.
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
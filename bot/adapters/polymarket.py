@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import json
+import functools
 import re
+from operator import attrgetter
 from typing import Any
 
-import requests
+import orjson
+
+from bot.adapters.http import build_session
+from bot.models.candidate import Candidate
 
 TEMP_HINT_RE = re.compile(r"\b(?:-?\d{1,3}\s*°?\s*[fc]|degrees?|fahrenheit|celsius|temperature|temp|high|low)\b")
 WEATHER_EVENT_RE = re.compile(
@@ -25,8 +29,23 @@ BLOCKLIST_TERMS = (
     "guilty",
 )
 
+_BLOCKLIST_RE = re.compile("|".join(map(re.escape, BLOCKLIST_TERMS)))
+
+_LIQUIDITY_KEYS = ("liquidity", "liquidityNum", "liquidityClob", "volume", "volumeNum")
+_MISSING = object()
+
+_SESSION = build_session()
+
 
 def _to_float(value: Any, default: float = 0.0) -> float:
+    # Fast paths for the common Gamma shapes; exact type checks skip the MRO walk of isinstance.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None:
+        return default
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -44,48 +63,49 @@ def _extract_yes_price(market: dict[str, Any]) -> float | None:
     prices = market.get("outcomePrices") or market.get("outcome_prices")
     if isinstance(outcomes, str):
         try:
-            outcomes = json.loads(outcomes)
-        except json.JSONDecodeError:
+            outcomes = orjson.loads(outcomes)
+        except orjson.JSONDecodeError:
             outcomes = None
     if isinstance(prices, str):
         try:
-            prices = json.loads(prices)
-        except json.JSONDecodeError:
+            prices = orjson.loads(prices)
+        except orjson.JSONDecodeError:
             prices = None
 
     if isinstance(outcomes, list) and isinstance(prices, list) and len(outcomes) == len(prices):
-        for idx, outcome in enumerate(outcomes):
-            if str(outcome).strip().lower() == "yes":
-                yes = _to_float(prices[idx], -1)
-                return yes if 0 <= yes <= 1 else None
+        idx = next((i for i, outcome in enumerate(outcomes) if str(outcome).strip().lower() == "yes"), -1)
+        if idx >= 0:
+            yes = _to_float(prices[idx], -1)
+            return yes if 0 <= yes <= 1 else None
     return None
 
 
 def _extract_liquidity(market: dict[str, Any]) -> float:
-    for key in ("liquidity", "liquidityNum", "liquidityClob", "volume", "volumeNum"):
-        if key in market:
-            return _to_float(market.get(key), 0.0)
+    # First key present wins, even if its value is 0 or null, so this is not an ``or`` chain.
+    for key in _LIQUIDITY_KEYS:
+        value = market.get(key, _MISSING)
+        if value is not _MISSING:
+            return _to_float(value, 0.0)
     return 0.0
 
 
-def _is_weather_market(question: str, keywords: list[str]) -> bool:
+@functools.lru_cache(maxsize=4096)
+def _is_weather_market(question: str) -> bool:
     q = question.lower()
-    if any(term in q for term in BLOCKLIST_TERMS):
+    # Every accepting path needs a weather event word. Most titles have none, so this scan
+    # runs first and is the only one they pay for; the blocklist only matters after a hit.
+    # (The configured keywords could only gate questions this already rejects.)
+    if WEATHER_EVENT_RE.search(q) is None:
         return False
 
-    keyword_hit = any(keyword.lower() in q for keyword in keywords)
-    weather_event_hit = WEATHER_EVENT_RE.search(q) is not None
-    temp_hint_hit = TEMP_HINT_RE.search(q) is not None
-    location_hint_hit = LOCATION_HINT_RE.search(question) is not None
-
-    if not keyword_hit and not weather_event_hit:
+    if _BLOCKLIST_RE.search(q):
         return False
 
     # "Hurricane" is often a sports team reference; require stronger context.
     if "hurricane" in q and not any(token in q for token in ("weather", "storm", "wind", "landfall", "category")):
         return False
 
-    return weather_event_hit and (temp_hint_hit or location_hint_hit or "weather" in q)
+    return "weather" in q or TEMP_HINT_RE.search(q) is not None or LOCATION_HINT_RE.search(question) is not None
 
 
 def _normalize_markets(payload: Any) -> list[dict[str, Any]]:
@@ -99,15 +119,14 @@ def _normalize_markets(payload: Any) -> list[dict[str, Any]]:
     return []
 
 
-def fetch_weather_candidates(cfg: dict[str, Any]) -> list[dict[str, Any]]:
+def fetch_weather_candidates(cfg: dict[str, Any]) -> list[Candidate]:
     bot_cfg = cfg["bot"]
     poly_cfg = cfg["polymarket"]
     timeout = int(bot_cfg["request_timeout_seconds"])
     scan_limit = int(bot_cfg["scan_limit"])
     min_liquidity = float(poly_cfg["min_liquidity"])
-    keywords = list(poly_cfg["weather_keywords"])
 
-    response = requests.get(
+    response = _SESSION.get(
         str(poly_cfg["gamma_url"]),
         params={
             "active": "true",
@@ -118,14 +137,14 @@ def fetch_weather_candidates(cfg: dict[str, Any]) -> list[dict[str, Any]]:
         timeout=timeout,
     )
     response.raise_for_status()
-    raw_markets = _normalize_markets(response.json())
+    raw_markets = _normalize_markets(orjson.loads(response.content))
 
-    candidates: list[dict[str, Any]] = []
+    candidates: list[Candidate] = []
     for market in raw_markets:
         question = str(market.get("question") or market.get("title") or "").strip()
         if not question:
             continue
-        if not _is_weather_market(question, keywords):
+        if not _is_weather_market(question):
             continue
         yes_price = _extract_yes_price(market)
         if yes_price is None:
@@ -135,13 +154,14 @@ def fetch_weather_candidates(cfg: dict[str, Any]) -> list[dict[str, Any]]:
             continue
 
         candidates.append(
-            {
-                "id": str(market.get("id") or market.get("conditionId") or market.get("slug") or question),
-                "question": question,
-                "yes_price": yes_price,
-                "liquidity": liquidity,
-                "raw": market,
-            }
+            Candidate(
+                id=str(market.get("id") or market.get("conditionId") or market.get("slug") or question),
+                question=question,
+                yes_price=yes_price,
+                liquidity=liquidity,
+                raw=market,
+            )
         )
 
-    return sorted(candidates, key=lambda x: x["liquidity"], reverse=True)
+    candidates.sort(key=attrgetter("liquidity"), reverse=True)
+    return candidates
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import bisect
 import datetime as dt
+import functools
 import math
 import re
-from typing import Any
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
 
-import requests
+import orjson
+
+from bot.adapters.http import build_session
 
 
 DATE_ISO_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
@@ -21,22 +28,26 @@ WEEKDAY_RE = re.compile(
 
 CITY_PATTERNS = [
     re.compile(
-        r"\b(?:in|at|for)\s+([A-Za-z][A-Za-z\.\-'\s]{1,60}?)(?=\s+(?:on|by|before|after|through|during|if|when|will|with|above|below|over|under|this|next|tomorrow|today)\b|[?.!,]|$)",
+        r"\b(?:in|at|for)\s++([A-Za-z][A-Za-z\.\-'\s]{1,60}?)(?=\s+(?:on|by|before|after|through|during|if|when|will|with|above|below|over|under|this|next|tomorrow|today)\b|[?.!,]|$)",
         re.IGNORECASE,
     ),
     re.compile(
-        r"\bwill\s+([A-Za-z][A-Za-z\.\-'\s]{1,50}?)\s+(?:hit|reach|get|see|have)\b",
+        r"\bwill\s++([A-Za-z][A-Za-z\.\-'\s]{1,50}?)\s+(?:hit|reach|get|see|have)\b",
         re.IGNORECASE,
     ),
-    re.compile(r"\b([A-Za-z][A-Za-z\.\-']+(?:\s+[A-Za-z][A-Za-z\.\-']+){0,3}),\s*([A-Z]{2})\b"),
+    re.compile(r"\b([A-Za-z][A-Za-z\.\-']++(?:\s++[A-Za-z][A-Za-z\.\-']++){0,3}),\s*([A-Z]{2})\b"),
 ]
+# Last fallback: title-case sequence before "weather/rain/temp" tokens.
+CITY_FALLBACK_RE = re.compile(
+    r"\b([A-Z][A-Za-z\.\-']++(?:\s++[A-Z][A-Za-z\.\-']++){0,3})\b(?=\s+(?:weather|rain|snow|temperature|temp)\b)"
+)
 
-TEMP_SYMBOL_RE = re.compile(r"(>=|<=|>|<)\s*(-?\d{1,3})\s*°?\s*([fc])?", re.IGNORECASE)
+TEMP_SYMBOL_RE = re.compile(r"(>=|<=|>|<)\s*+(-?\d{1,3}+)\s*°?\s*([fc])?", re.IGNORECASE)
 TEMP_WORD_RE = re.compile(
-    r"(?:above|over|at\s+least|greater\s+than|below|under|at\s+most|less\s+than)\s+(-?\d{1,3})\s*(?:°?\s*([fc])|degrees?)?",
+    r"\b(?:above|over|at\s+least|greater\s+than|below|under|at\s+most|less\s+than)\s++(-?\d{1,3}+)\s*(?:°?\s*([fc])|degrees?)?",
     re.IGNORECASE,
 )
-TEMP_REACH_RE = re.compile(r"(?:hit|reach|get to|top|high of)\s+(-?\d{1,3})\s*(?:°?\s*([fc]))?", re.IGNORECASE)
+TEMP_REACH_RE = re.compile(r"\b(?:hit|reach|get to|top|high of)\s++(-?\d{1,3}+)\s*(?:°?\s*([fc]))?", re.IGNORECASE)
 
 MONTHS = {
     "jan": 1,
@@ -76,33 +87,105 @@ STOP_TOKENS = {
     "is",
 }
 
+_SESSION = build_session()
+
+_GEOCODE_MAX_CANDIDATES = 4
+_FORECAST_BATCH_SIZE = 50
+_HOURLY_FIELDS = "temperature_2m,precipitation_probability"
+_GEOCODE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="geocode")
+# Separate pool: market tasks block on geocode tasks, so sharing one pool could deadlock.
+_MARKET_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="weather")
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl_seconds`` after they are stored."""
+
+    def __init__(self, ttl_seconds: float, maxsize: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: dict[Any, tuple[float, Any]] = {}
+        self._loading: dict[Any, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        return value
+
+    def _store(self, key: Any, value: Any) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            # Dicts keep insertion order, so the first entry is the oldest.
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_load(self, key: Any, loader: Callable[[], Any]) -> Any:
+        # Concurrent misses for one key share a single loader call instead of each hitting the network.
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+            pending = self._loading.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._loading[key] = Future()
+        if not owner:
+            return pending.result()
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._loading[key]
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self._store(key, value)
+            del self._loading[key]
+        pending.set_result(value)
+        return value
+
+
+# Geocoder misses are cached too (as None) so unparseable candidates are not re-probed.
+_GEOCODE_CACHE = _TTLCache(ttl_seconds=24 * 3600, maxsize=1024)
+_FORECAST_CACHE = _TTLCache(ttl_seconds=900, maxsize=256)
+
 
 def _fahrenheit_to_celsius(value_f: float) -> float:
     return (value_f - 32.0) * 5.0 / 9.0
 
 
-def _candidate_cities(question: str) -> list[str]:
+@functools.lru_cache(maxsize=4096)
+def _candidate_cities(question: str) -> tuple[str, ...]:
     out: list[str] = []
-    for pattern in CITY_PATTERNS:
+    city_pattern, will_pattern, state_pattern = CITY_PATTERNS
+    for pattern in (city_pattern, will_pattern):
         for match in pattern.finditer(question):
-            if pattern is CITY_PATTERNS[2]:
-                city = f"{match.group(1).strip()}, {match.group(2).strip()}"
-            else:
-                city = match.group(1).strip(" ,.?")
-            if not city:
-                continue
-            lower_city = city.lower()
-            if lower_city in STOP_TOKENS:
-                continue
-            if len(city) < 2:
-                continue
+            city = match.group(1).strip(" ,.?")
+            if len(city) >= 2 and city.lower() not in STOP_TOKENS:
+                out.append(city)
+    for match in state_pattern.finditer(question):
+        city = f"{match.group(1).strip()}, {match.group(2).strip()}"
+        if city.lower() not in STOP_TOKENS:
             out.append(city)
 
-    # Last fallback: title-case sequence before "weather/rain/temp" tokens.
-    fallback = re.search(
-        r"\b([A-Z][A-Za-z\.\-']+(?:\s+[A-Z][A-Za-z\.\-']+){0,3})\b(?=\s+(?:weather|rain|snow|temperature|temp)\b)",
-        question,
-    )
+    fallback = CITY_FALLBACK_RE.search(question)
     if fallback:
         out.append(fallback.group(1).strip())
 
@@ -114,7 +197,7 @@ def _candidate_cities(question: str) -> list[str]:
             continue
         seen.add(key)
         deduped.append(city)
-    return deduped
+    return tuple(deduped)
 
 
 def _parse_weekday_date(token: str, today: dt.date) -> list[dt.date]:
@@ -136,12 +219,17 @@ def _parse_weekday_date(token: str, today: dt.date) -> list[dt.date]:
 
 
 def _extract_target_dates(question: str) -> list[dt.date] | None:
-    today = dt.datetime.utcnow().date()
+    dates = _parse_target_dates(question, dt.datetime.utcnow().date())
+    return list(dates) if dates else None
 
+
+@functools.lru_cache(maxsize=4096)
+def _parse_target_dates(question: str, today: dt.date) -> tuple[dt.date, ...] | None:
+    # Keyed on ``today`` too: relative dates ("tomorrow", "friday") move with the calendar.
     iso_match = DATE_ISO_RE.search(question)
     if iso_match:
         try:
-            return [dt.date.fromisoformat(iso_match.group(1))]
+            return (dt.date.fromisoformat(iso_match.group(1)),)
         except ValueError:
             pass
 
@@ -157,7 +245,7 @@ def _extract_target_dates(question: str) -> list[dt.date] | None:
                 candidate = dt.date(year, month, day)
                 if not explicit_year and candidate < today:
                     candidate = dt.date(year + 1, month, day)
-                return [candidate]
+                return (candidate,)
             except ValueError:
                 pass
 
@@ -175,21 +263,21 @@ def _extract_target_dates(question: str) -> list[dt.date] | None:
             candidate = dt.date(year, month, day)
             if not year_raw and candidate < today:
                 candidate = dt.date(year + 1, month, day)
-            return [candidate]
+            return (candidate,)
         except ValueError:
             pass
 
     weekday_match = WEEKDAY_RE.search(question)
     if weekday_match:
         dates = _parse_weekday_date(weekday_match.group(1), today)
-        return dates or None
+        return tuple(dates) or None
     return None
 
 
-def _infer_temp_unit(raw_value: float, raw_unit: str | None, question: str) -> str:
+def _infer_temp_unit(raw_value: float, raw_unit: str | None, q: str) -> str:
+    # ``q`` is the already-lowercased question.
     if raw_unit:
         return raw_unit.lower()
-    q = question.lower()
     if "fahrenheit" in q:
         return "f"
     if "celsius" in q or "centigrade" in q:
@@ -200,6 +288,7 @@ def _infer_temp_unit(raw_value: float, raw_unit: str | None, question: str) -> s
     return "c"
 
 
+@functools.lru_cache(maxsize=4096)
 def _extract_temp_rule(question: str) -> tuple[str, float] | None:
     q = question.lower()
     if "below freezing" in q or "under freezing" in q:
@@ -211,7 +300,7 @@ def _extract_temp_rule(question: str) -> tuple[str, float] | None:
     if symbol_match:
         op = symbol_match.group(1)
         value_raw = float(symbol_match.group(2))
-        unit = _infer_temp_unit(value_raw, symbol_match.group(3), question)
+        unit = _infer_temp_unit(value_raw, symbol_match.group(3), q)
         value_c = _fahrenheit_to_celsius(value_raw) if unit == "f" else value_raw
         op_norm = ">=" if op in {">", ">="} else "<="
         return op_norm, value_c
@@ -220,7 +309,7 @@ def _extract_temp_rule(question: str) -> tuple[str, float] | None:
     if word_match:
         phrase = word_match.group(0).lower()
         value_raw = float(word_match.group(1))
-        unit = _infer_temp_unit(value_raw, word_match.group(2), question)
+        unit = _infer_temp_unit(value_raw, word_match.group(2), q)
         value_c = _fahrenheit_to_celsius(value_raw) if unit == "f" else value_raw
         if any(token in phrase for token in ("above", "over", "at least", "greater than")):
             return (">=", value_c)
@@ -229,44 +318,54 @@ def _extract_temp_rule(question: str) -> tuple[str, float] | None:
     reach_match = TEMP_REACH_RE.search(question)
     if reach_match:
         value_raw = float(reach_match.group(1))
-        unit = _infer_temp_unit(value_raw, reach_match.group(2), question)
+        unit = _infer_temp_unit(value_raw, reach_match.group(2), q)
         value_c = _fahrenheit_to_celsius(value_raw) if unit == "f" else value_raw
         return (">=", value_c)
 
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_precip_market(question: str) -> bool:
     q = question.lower()
     return any(token in q for token in ("rain", "precip", "storm", "thunder", "shower"))
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_snow_market(question: str) -> bool:
     q = question.lower()
     return any(token in q for token in ("snow", "blizzard", "sleet", "flurr"))
 
 
+def _minute_key(moment: dt.datetime) -> str:
+    # Same "YYYY-MM-DDTHH:MM" shape as Open-Meteo; isoformat skips strftime's format parsing.
+    return moment.isoformat(timespec="minutes")
+
+
 def _pick_window(
-    timeline: list[dt.datetime],
+    timeline: list[str],
     values: list[float],
     target_dates: list[dt.date] | None,
     lookahead_hours: int,
 ) -> list[float]:
-    now = dt.datetime.utcnow().replace(tzinfo=None)
-    out: list[float] = []
-
+    # Open-Meteo timestamps are ascending "YYYY-MM-DDTHH:MM" strings, which sort chronologically,
+    # so each window is a bisected slice rather than a per-hour comparison.
     if target_dates:
-        date_set = set(target_dates)
-        for ts, value in zip(timeline, values):
-            if ts.date() in date_set:
-                out.append(value)
+        out: list[float] = []
+        for day in sorted(set(target_dates)):
+            lo = bisect.bisect_left(timeline, day.isoformat())
+            hi = bisect.bisect_left(timeline, (day + dt.timedelta(days=1)).isoformat(), lo)
+            out.extend(values[lo:hi])
         return out
 
-    horizon = now + dt.timedelta(hours=lookahead_hours)
-    for ts, value in zip(timeline, values):
-        if now <= ts <= horizon:
-            out.append(value)
-    return out
+    now = dt.datetime.utcnow()
+    # Timestamps are whole minutes: ts >= now means ts >= now rounded up to the minute.
+    start = now.replace(second=0, microsecond=0)
+    if start < now:
+        start += dt.timedelta(minutes=1)
+    lo = bisect.bisect_left(timeline, _minute_key(start))
+    hi = bisect.bisect_right(timeline, _minute_key(now + dt.timedelta(hours=lookahead_hours)), lo)
+    return values[lo:hi]
 
 
 def _calc_confidence(prob: float, sample_count: int, boost: float = 1.0) -> float:
@@ -297,69 +396,153 @@ def _temperature_probability(temp_values: list[float], rule: tuple[str, float])
 def _precip_probability(precip_probs: list[float]) -> float:
     if not precip_probs:
         return 0.5
-    hourly = [max(0.0, min(v / 100.0, 1.0)) for v in precip_probs]
-    any_prob = 1.0
-    for p in hourly:
-        any_prob *= (1.0 - p)
-    any_prob = 1.0 - any_prob
-    max_prob = max(hourly)
-    avg_prob = sum(hourly) / len(hourly)
+    # Single pass: clamp each hourly chance and fold it into max, sum and P(no precip) together.
+    max_prob = 0.0
+    total = 0.0
+    none_prob = 1.0
+    for v in precip_probs:
+        p = v / 100.0
+        if p < 0.0:
+            p = 0.0
+        elif p > 1.0:
+            p = 1.0
+        if p > max_prob:
+            max_prob = p
+        total += p
+        none_prob *= 1.0 - p
+    any_prob = 1.0 - none_prob
+    avg_prob = total / len(precip_probs)
     return max(0.0, min(0.55 * max_prob + 0.35 * any_prob + 0.10 * avg_prob, 1.0))
 
 
-def _resolve_location(question: str, cfg: dict[str, Any], timeout: int) -> tuple[dict[str, Any] | None, str]:
-    weather_cfg = cfg["weather"]
-    city_candidates = _candidate_cities(question)
-    if not city_candidates:
-        return None, "Could not parse city from market question."
-
-    for city in city_candidates:
-        geo_resp = requests.get(
-            str(weather_cfg["geocode_url"]),
+def _geocode_city(geocode_url: str, city: str, timeout: int) -> dict[str, Any] | None:
+    def load() -> dict[str, Any] | None:
+        geo_resp = _SESSION.get(
+            geocode_url,
             params={"name": city, "count": 1, "language": "en", "format": "json"},
             timeout=timeout,
         )
         geo_resp.raise_for_status()
-        geo_results = geo_resp.json().get("results") or []
-        if geo_results:
-            return geo_results[0], city
+        geo_results = orjson.loads(geo_resp.content).get("results") or []
+        return geo_results[0] if geo_results else None
 
-    return None, f"Could not geocode parsed city candidates: {city_candidates}"
+    return _GEOCODE_CACHE.get_or_load((geocode_url, city.lower()), load)
 
 
-def estimate_yes_probability(question: str, cfg: dict[str, Any]) -> tuple[float, float, str]:
-    weather_cfg = cfg["weather"]
-    bot_cfg = cfg["bot"]
-    timeout = int(bot_cfg["request_timeout_seconds"])
-    lookahead_hours = int(weather_cfg["lookahead_hours"])
+def _forecast_key(forecast_url: str, latitude: float, longitude: float) -> tuple[str, float, float]:
+    return (forecast_url, round(latitude, 3), round(longitude, 3))
+
+
+def _hourly_series(payload: dict[str, Any]) -> tuple[list[str], list[float], list[float]]:
+    hourly = payload.get("hourly") or {}
+    # Convert to floats once per fetch; every market at this location reuses the cached series.
+    return (
+        list(hourly.get("time") or []),
+        [float(x) for x in hourly.get("temperature_2m") or []],
+        [float(x) for x in hourly.get("precipitation_probability") or []],
+    )
+
+
+def _fetch_hourly(
+    forecast_url: str,
+    latitude: float,
+    longitude: float,
+    timeout: int,
+) -> tuple[list[str], list[float], list[float]]:
+    def load() -> tuple[list[str], list[float], list[float]]:
+        forecast_resp = _SESSION.get(
+            forecast_url,
+            params={
+                "latitude": latitude,
+                "longitude": longitude,
+                "hourly": _HOURLY_FIELDS,
+                "forecast_days": 16,
+                "timezone": "UTC",
+            },
+            timeout=timeout,
+        )
+        forecast_resp.raise_for_status()
+        return _hourly_series(orjson.loads(forecast_resp.content))
+
+    return _FORECAST_CACHE.get_or_load(_forecast_key(forecast_url, latitude, longitude), load)
+
+
+def _fetch_hourly_many(
+    forecast_url: str,
+    coords: list[tuple[float, float]],
+    timeout: int,
+) -> None:
+    # Open-Meteo accepts comma-separated coordinates and answers with one payload per location, in order.
+    # Best-effort prefetch: a failed chunk is left uncached and its locations are fetched individually later.
+    for start in range(0, len(coords), _FORECAST_BATCH_SIZE):
+        chunk = coords[start : start + _FORECAST_BATCH_SIZE]
+        if len(chunk) == 1:
+            continue
+        try:
+            forecast_resp = _SESSION.get(
+                forecast_url,
+                params={
+                    "latitude": ",".join(str(lat) for lat, _ in chunk),
+                    "longitude": ",".join(str(lon) for _, lon in chunk),
+                    "hourly": _HOURLY_FIELDS,
+                    "forecast_days": 16,
+                    "timezone": "UTC",
+                },
+                timeout=timeout,
+            )
+            forecast_resp.raise_for_status()
+            payloads = orjson.loads(forecast_resp.content)
+            if not isinstance(payloads, list) or len(payloads) != len(chunk):
+                continue
+            series = [_hourly_series(payload) for payload in payloads]
+        except Exception:
+            continue
+        for (latitude, longitude), location_series in zip(chunk, series):
+            _FORECAST_CACHE.set(_forecast_key(forecast_url, latitude, longitude), location_series)
 
-    place, parsed_city = _resolve_location(question, cfg, timeout)
-    if not place:
-        return 0.5, 0.15, parsed_city
 
-    latitude = float(place["latitude"])
-    longitude = float(place["longitude"])
+def _resolve_location(question: str, cfg: dict[str, Any], timeout: int) -> tuple[dict[str, Any] | None, str]:
+    weather_cfg = cfg["weather"]
+    city_candidates = _candidate_cities(question)
+    if not city_candidates:
+        return None, "Could not parse city from market question."
+
+    # Probe uncached candidates concurrently, but keep the original priority order when picking a hit.
+    geocode_url = str(weather_cfg["geocode_url"])
+    probes: list[tuple[str, Future[dict[str, Any] | None] | dict[str, Any]]] = []
+    for city in city_candidates[:_GEOCODE_MAX_CANDIDATES]:
+        cached = _GEOCODE_CACHE.get((geocode_url, city.lower()), _MISSING)
+        if cached is _MISSING:
+            probes.append((city, _GEOCODE_EXECUTOR.submit(_geocode_city, geocode_url, city, timeout)))
+        elif cached:
+            probes.append((city, cached))
+            break
+    try:
+        for city, probe in probes:
+            place = probe.result() if isinstance(probe, Future) else probe
+            if place:
+                return place, city
+    finally:
+        for _, probe in probes:
+            if isinstance(probe, Future):
+                probe.cancel()
+
+    return None, f"Could not geocode parsed city candidates: {list(city_candidates)}"
+
+
+def _location_label(place: dict[str, Any], parsed_city: str) -> str:
     normalized_city = str(place.get("name") or parsed_city)
     country = str(place.get("country") or "")
-    location_label = f"{normalized_city}, {country}".strip(", ")
-
-    forecast_resp = requests.get(
-        str(weather_cfg["forecast_url"]),
-        params={
-            "latitude": latitude,
-            "longitude": longitude,
-            "hourly": "temperature_2m,precipitation_probability",
-            "forecast_days": 16,
-            "timezone": "UTC",
-        },
-        timeout=timeout,
-    )
-    forecast_resp.raise_for_status()
-    hourly = forecast_resp.json().get("hourly") or {}
+    return f"{normalized_city}, {country}".strip(", ")
+
 
-    timestamps = [dt.datetime.fromisoformat(x) for x in hourly.get("time") or []]
-    temps = [float(x) for x in hourly.get("temperature_2m") or []]
-    precip_probs = [float(x) for x in hourly.get("precipitation_probability") or []]
+def _score_question(
+    question: str,
+    location_label: str,
+    series: tuple[list[str], list[float], list[float]],
+    lookahead_hours: int,
+) -> tuple[float, float, str]:
+    timestamps, temps, precip_probs = series
 
     if not timestamps or not temps:
         return 0.5, 0.2, f"No hourly forecast returned for {location_label}."
@@ -402,3 +585,75 @@ def estimate_yes_probability(question: str, cfg: dict[str, Any]) -> tuple[float,
     )
     return model_prob, confidence, rationale
 
+
+def estimate_yes_probability(question: str, cfg: dict[str, Any]) -> tuple[float, float, str]:
+    weather_cfg = cfg["weather"]
+    timeout = int(cfg["bot"]["request_timeout_seconds"])
+
+    place, parsed_city = _resolve_location(question, cfg, timeout)
+    if not place:
+        return 0.5, 0.15, parsed_city
+
+    series = _fetch_hourly(
+        str(weather_cfg["forecast_url"]), float(place["latitude"]), float(place["longitude"]), timeout
+    )
+    return _score_question(question, _location_label(place, parsed_city), series, int(weather_cfg["lookahead_hours"]))
+
+
+def estimate_yes_probabilities(
+    questions: list[str],
+    cfg: dict[str, Any],
+) -> list[tuple[float, float, str] | Exception]:
+    # A question that fails yields its exception in place so callers can fail open per market.
+    weather_cfg = cfg["weather"]
+    timeout = int(cfg["bot"]["request_timeout_seconds"])
+    forecast_url = str(weather_cfg["forecast_url"])
+    lookahead_hours = int(weather_cfg["lookahead_hours"])
+
+    futures = [_MARKET_EXECUTOR.submit(_resolve_location, question, cfg, timeout) for question in questions]
+    resolved: list[tuple[dict[str, Any] | None, str] | Exception] = []
+    for future in futures:
+        try:
+            resolved.append(future.result())
+        except Exception as exc:
+            resolved.append(exc)
+
+    pending: dict[tuple[str, float, float], tuple[float, float]] = {}
+    for item in resolved:
+        if isinstance(item, Exception) or not item[0]:
+            continue
+        try:
+            latitude, longitude = float(item[0]["latitude"]), float(item[0]["longitude"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        key = _forecast_key(forecast_url, latitude, longitude)
+        if key not in pending and _FORECAST_CACHE.get(key) is None:
+            pending[key] = (latitude, longitude)
+
+    if pending:
+        _fetch_hourly_many(forecast_url, list(pending.values()), timeout)
+
+    def score(question: str, place: dict[str, Any], parsed_city: str) -> tuple[float, float, str]:
+        # Anything the batch did not cache is fetched per location, so a failure only affects that location.
+        series = _fetch_hourly(forecast_url, float(place["latitude"]), float(place["longitude"]), timeout)
+        return _score_question(question, _location_label(place, parsed_city), series, lookahead_hours)
+
+    scored: list[Future[tuple[float, float, str]] | tuple[float, float, str] | Exception] = []
+    for question, item in zip(questions, resolved):
+        if isinstance(item, Exception):
+            scored.append(item)
+        elif not item[0]:
+            scored.append((0.5, 0.15, item[1]))
+        else:
+            scored.append(_MARKET_EXECUTOR.submit(score, question, item[0], item[1]))
+
+    results: list[tuple[float, float, str] | Exception] = []
+    for outcome in scored:
+        if isinstance(outcome, Future):
+            try:
+                results.append(outcome.result())
+            except Exception as exc:
+                results.append(exc)
+        else:
+            results.append(outcome)
+    return results
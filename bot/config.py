@@ -7,6 +7,11 @@ from typing import Any, Callable
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
 
 DEFAULT_CONFIG: dict[str, Any] = {
     "bot": {
@@ -53,6 +58,14 @@ DEFAULT_CONFIG: dict[str, Any] = {
 }
 
 
+def _clone_default() -> dict[str, Any]:
+    # DEFAULT_CONFIG is sections of scalars and flat lists, so two levels of copying is a full copy.
+    return {
+        section: {key: list(value) if isinstance(value, list) else value for key, value in values.items()}
+        for section, values in DEFAULT_CONFIG.items()
+    }
+
+
 def _parse_bool(raw: str) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
@@ -80,6 +93,14 @@ ENV_MAP: dict[str, tuple[str, Callable[[str], Any]]] = {
     "PAPER_CLOSE_EDGE_BPS": ("paper.close_edge_bps", int),
 }
 
+# ENV_MAP with dotted paths pre-split, so load_config does no per-key splitting or dict iteration.
+_ENV_ITEMS: tuple[tuple[str, tuple[str, ...], Callable[[str], Any]], ...] = tuple(
+    (env_key, tuple(path.split(".")), parser) for env_key, (path, parser) in ENV_MAP.items()
+)
+
+
+_YAML_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     for key, value in override.items():
@@ -90,33 +111,47 @@ def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]
     return base
 
 
-def set_path(config: dict[str, Any], dotted_path: str, value: Any) -> None:
-    parts = dotted_path.split(".")
+def set_path(config: dict[str, Any], parts: tuple[str, ...], value: Any) -> None:
     node: dict[str, Any] = config
-    for part in parts[:-1]:
+    last = len(parts) - 1
+    for i in range(last):
+        part = parts[i]
         current = node.get(part)
         if not isinstance(current, dict):
             current = {}
             node[part] = current
         node = current
-    node[parts[-1]] = value
+    node[parts[last]] = value
+
+
+def _read_yaml(path: Path) -> dict[str, Any]:
+    # Parsed files are reused until their mtime or size changes; callers must not mutate the result.
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with path.open("r", encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=_Loader) or {}
+    if not isinstance(raw, dict):
+        raise ValueError(f"Expected dict in config file: {path}")
+    _YAML_CACHE[str(path)] = (stamp, raw)
+    return raw
 
 
 def load_config(config_path: str | None) -> dict[str, Any]:
-    cfg = copy.deepcopy(DEFAULT_CONFIG)
+    cfg = _clone_default()
     if config_path:
         path = Path(config_path)
         if path.exists():
-            with path.open("r", encoding="utf-8") as f:
-                raw = yaml.safe_load(f) or {}
-            if not isinstance(raw, dict):
-                raise ValueError(f"Expected dict in config file: {path}")
-            deep_merge(cfg, raw)
-
-    for env_key, (path, parser) in ENV_MAP.items():
-        raw_value = os.getenv(env_key)
+            deep_merge(cfg, copy.deepcopy(_read_yaml(path)))
+
+    environ = os.environ
+    for env_key, parts, parser in _ENV_ITEMS:
+        raw_value = environ.get(env_key)
         if raw_value is None:
             continue
-        set_path(cfg, path, parser(raw_value))
+        set_path(cfg, parts, parser(raw_value))
 
     return cfg
@@ -1,49 +1,67 @@
 from __future__ import annotations
 
-import datetime as dt
 from typing import Any
 
 from bot.adapters.polymarket import fetch_weather_candidates
-from bot.adapters.weather import estimate_yes_probability
-from bot.core.paper import apply_paper_trading
+from bot.adapters.weather import estimate_yes_probabilities
+from bot.core.paper import apply_paper_trading, now_iso
+from bot.models.candidate import Candidate
 from bot.models.signal import Signal, evaluate_signal
 
 
+def _evaluate_market(
+    cfg: dict[str, Any],
+    market: Candidate,
+    estimate: tuple[float, float, str],
+    include_evaluation: bool,
+) -> tuple[Signal | None, dict[str, Any] | None]:
+    model_prob, confidence, rationale = estimate
+    signal = evaluate_signal(
+        market=market,
+        model_prob=model_prob,
+        confidence=confidence,
+        rationale=rationale,
+        cfg=cfg,
+    )
+    if not include_evaluation:
+        return signal, None
+
+    market_yes_prob = market.yes_price
+    row = {
+        "market_id": market.id,
+        "question": market.question,
+        "liquidity": round(market.liquidity, 2),
+        "market_yes_prob": round(market_yes_prob, 4),
+        "model_yes_prob": round(float(model_prob), 4),
+        "confidence": round(float(confidence), 4),
+        "edge_bps": int(round((model_prob - market_yes_prob) * 10_000)),
+        "signal_action": signal.action if signal else None,
+    }
+    return signal, row
+
+
 def run_scan(cfg: dict[str, Any], mode: str = "alert") -> dict[str, Any]:
+    now = now_iso()
+    paper_enabled = bool(cfg["paper"]["enabled"]) or mode == "paper"
+    # Per-market evaluation rows feed paper trading and the one-shot scan report; the
+    # long-running alert worker only needs the alerts, so it skips building them.
+    include_evaluations = paper_enabled or mode == "scan"
+
     candidates = fetch_weather_candidates(cfg)
     alerts: list[Signal] = []
     evaluations: list[dict[str, Any]] = []
     skipped = 0
 
-    for market in candidates:
-        try:
-            model_prob, confidence, rationale = estimate_yes_probability(
-                question=str(market["question"]),
-                cfg=cfg,
-            )
-            market_yes_prob = float(market["yes_price"])
-            edge_bps = int(round((model_prob - market_yes_prob) * 10_000))
-            signal = evaluate_signal(
-                market=market,
-                model_prob=model_prob,
-                confidence=confidence,
-                rationale=rationale,
-                cfg=cfg,
-            )
-
-            evaluations.append(
-                {
-                    "market_id": str(market["id"]),
-                    "question": str(market["question"]),
-                    "liquidity": round(float(market["liquidity"]), 2),
-                    "market_yes_prob": round(market_yes_prob, 4),
-                    "model_yes_prob": round(float(model_prob), 4),
-                    "confidence": round(float(confidence), 4),
-                    "edge_bps": edge_bps,
-                    "signal_action": signal.action if signal else None,
-                }
-            )
+    # Forecast lookups are I/O bound, so every candidate is scored concurrently up front.
+    estimates = estimate_yes_probabilities([market.question for market in candidates], cfg)
 
+    for market, estimate in zip(candidates, estimates):
+        try:
+            if isinstance(estimate, Exception):
+                raise estimate
+            signal, row = _evaluate_market(cfg, market, estimate, include_evaluations)
+            if row is not None:
+                evaluations.append(row)
             if signal is None:
                 skipped += 1
                 continue
@@ -51,19 +69,19 @@ def run_scan(cfg: dict[str, Any], mode: str = "alert") -> dict[str, Any]:
         except Exception as exc:  # pragma: no cover - fail-open by market
             skipped += 1
             print(
-                f"[warn] market={market.get('id')} skipped due to adapter error: {exc}",
+                f"[warn] market={market.id} skipped due to adapter error: {exc}",
                 flush=True,
             )
 
     payload: dict[str, Any] = {
-        "timestamp": dt.datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "timestamp": now,
         "scanned_count": len(candidates),
         "skipped_count": skipped,
         "alerts_count": len(alerts),
         "alerts": [a.to_dict() for a in alerts],
-        "evaluations": evaluations,
     }
-    paper_enabled = bool(cfg["paper"]["enabled"]) or mode == "paper"
+    if include_evaluations:
+        payload["evaluations"] = evaluations
     if paper_enabled:
-        payload["paper"] = apply_paper_trading(cfg, evaluations, alerts)
+        payload["paper"] = apply_paper_trading(cfg, evaluations, alerts, now=now)
     return payload
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-import datetime as dt
-import json
+import functools
+import os
+import time
+from collections import deque
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from bot.models.signal import Signal
 
+_MAX_TRADES = 1000
+
 
+@functools.lru_cache(maxsize=4)
 def _resolve_state_path(raw_path: str) -> Path:
     path = Path(raw_path).expanduser()
     if path.is_absolute():
@@ -15,8 +22,8 @@ def _resolve_state_path(raw_path: str) -> Path:
     return (Path.cwd() / path).resolve()
 
 
-def _now_iso() -> str:
-    return dt.datetime.utcnow().isoformat(timespec="seconds") + "Z"
+def now_iso() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def _price_for_side(yes_price: float, side: str) -> float:
@@ -34,26 +41,29 @@ def _signal_side(action: str) -> str:
 
 def _load_state(path: Path, starting_cash_usd: float) -> dict[str, Any]:
     if path.exists():
-        with path.open("r", encoding="utf-8") as f:
-            loaded = json.load(f)
+        loaded = orjson.loads(path.read_bytes())
         if isinstance(loaded, dict):
             loaded.setdefault("cash_usd", float(starting_cash_usd))
             loaded.setdefault("positions", {})
-            loaded.setdefault("trades", [])
+            loaded["trades"] = deque(loaded.get("trades") or [], maxlen=_MAX_TRADES)
             return loaded
-    return {"cash_usd": float(starting_cash_usd), "positions": {}, "trades": []}
+    return {"cash_usd": float(starting_cash_usd), "positions": {}, "trades": deque(maxlen=_MAX_TRADES)}
 
 
 def _save_state(path: Path, state: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, sort_keys=True)
+    # Write beside the target and rename over it so a crash mid-write never leaves a torn state file.
+    tmp_path = path.with_name(path.name + ".tmp")
+    payload = {**state, "trades": list(state["trades"])}
+    tmp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    os.replace(tmp_path, path)
 
 
 def apply_paper_trading(
     cfg: dict[str, Any],
     evaluations: list[dict[str, Any]],
     alerts: list[Signal],
+    now: str | None = None,
 ) -> dict[str, Any]:
     paper_cfg = cfg["paper"]
     state_path = _resolve_state_path(str(paper_cfg["state_path"]))
@@ -61,18 +71,21 @@ def apply_paper_trading(
 
     cash = float(state["cash_usd"])
     positions: dict[str, dict[str, Any]] = state["positions"]
-    trades: list[dict[str, Any]] = list(state.get("trades") or [])
+    trades: deque[dict[str, Any]] = state["trades"]
 
     position_size_usd = float(paper_cfg["position_size_usd"])
     max_open_positions = int(paper_cfg["max_open_positions"])
     close_edge_bps = int(paper_cfg["close_edge_bps"])
-    now = _now_iso()
+    now = now or now_iso()
 
-    eval_by_market = {str(row["market_id"]): row for row in evaluations}
+    eval_by_market = {row["market_id"]: row for row in evaluations}
     signal_by_market = {s.market_id: s for s in alerts}
 
     opened: list[dict[str, Any]] = []
     closed: list[dict[str, Any]] = []
+    # (yes_price, mark_value, rounded mark_value) per surviving position, so the marks pass
+    # neither re-values nor re-rounds them.
+    marks: dict[str, tuple[float, float, float]] = {}
 
     # Close pass.
     for market_id, position in list(positions.items()):
@@ -118,13 +131,16 @@ def apply_paper_trading(
             closed.append(close_trade)
             del positions[market_id]
         else:
+            mark_value_usd = round(current_value, 2)
+            marks[market_id] = (yes_price, current_value, mark_value_usd)
             position["last_yes_price"] = yes_price
-            position["last_mark_value_usd"] = round(current_value, 2)
+            position["last_mark_value_usd"] = mark_value_usd
             position["last_mark_ts"] = now
 
     # Open pass (highest edge first).
-    sorted_alerts = sorted(alerts, key=lambda s: abs(s.edge_bps), reverse=True)
-    for signal in sorted_alerts:
+    edge_keys = [abs(s.edge_bps) for s in alerts]
+    for index in sorted(range(len(alerts)), key=edge_keys.__getitem__, reverse=True):
+        signal = alerts[index]
         if len(positions) >= max_open_positions:
             break
         market_id = signal.market_id
@@ -157,6 +173,8 @@ def apply_paper_trading(
             "last_mark_ts": now,
         }
         positions[market_id] = new_position
+        mark_value = qty * unit_price
+        marks[market_id] = (yes_price, mark_value, round(mark_value, 2))
 
         open_trade = {
             "ts": now,
@@ -178,10 +196,8 @@ def apply_paper_trading(
     total_mark_value = 0.0
     total_cost = 0.0
     for market_id, position in positions.items():
-        row = eval_by_market.get(market_id)
-        yes_price = float(row["market_yes_prob"]) if row else float(position.get("last_yes_price", position["entry_yes_price"]))
+        yes_price, mark_value, mark_value_usd = marks[market_id]
         qty = float(position["qty"])
-        mark_value = _value_for_side(qty, yes_price, str(position["side"]))
         cost = float(position["cost_usd"])
         total_mark_value += mark_value
         total_cost += cost
@@ -194,7 +210,7 @@ def apply_paper_trading(
                 "entry_yes_price": round(float(position["entry_yes_price"]), 6),
                 "mark_yes_price": round(yes_price, 6),
                 "cost_usd": round(cost, 2),
-                "mark_value_usd": round(mark_value, 2),
+                "mark_value_usd": mark_value_usd,
                 "unrealized_pnl_usd": round(mark_value - cost, 2),
             }
         )
@@ -215,7 +231,6 @@ def apply_paper_trading(
 
     state["cash_usd"] = cash
     state["positions"] = positions
-    state["trades"] = trades[-1000:]
     state["updated_at"] = now
     state["last_summary"] = summary
     _save_state(state_path, state)
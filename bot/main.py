@@ -5,9 +5,6 @@ import json
 import os
 import time
 
-from bot.config import load_config
-from bot.core.engine import run_scan
-
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Polymarket weather signal bot")
@@ -27,6 +24,10 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
+    # Deferred so argument errors and --help return without importing the adapters and HTTP stack.
+    from bot.config import load_config
+    from bot.core.engine import run_scan
+
     cfg = load_config(args.config)
     interval = int(cfg["bot"]["scan_interval_seconds"])
 
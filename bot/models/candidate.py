@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class Candidate:
+    id: str
+    question: str
+    yes_price: float
+    liquidity: float
+    raw: dict[str, Any]
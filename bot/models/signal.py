@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any
 
+from bot.models.candidate import Candidate
 
-@dataclass
+
+@dataclass(slots=True)
 class Signal:
     market_id: str
     question: str
@@ -17,27 +19,34 @@ class Signal:
     rationale: str
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "market_id": self.market_id,
+            "question": self.question,
+            "action": self.action,
+            "market_yes_prob": self.market_yes_prob,
+            "model_yes_prob": self.model_yes_prob,
+            "edge_bps": self.edge_bps,
+            "confidence": self.confidence,
+            "liquidity": self.liquidity,
+            "rationale": self.rationale,
+        }
 
 
 def evaluate_signal(
-    market: dict[str, Any],
+    market: Candidate,
     model_prob: float,
     confidence: float,
     rationale: str,
     cfg: dict[str, Any],
 ) -> Signal | None:
     signal_cfg = cfg["signal"]
-    min_edge_bps = int(signal_cfg["min_edge_bps"])
-    min_confidence = float(signal_cfg["min_confidence"])
+    if confidence < float(signal_cfg["min_confidence"]):
+        return None
 
-    market_yes_prob = float(market["yes_price"])
-    liquidity = float(market["liquidity"])
+    min_edge_bps = int(signal_cfg["min_edge_bps"])
+    market_yes_prob = market.yes_price
     edge_bps = int(round((model_prob - market_yes_prob) * 10_000))
 
-    if confidence < min_confidence:
-        return None
-
     if edge_bps >= min_edge_bps:
         action = "BUY_YES"
     elif edge_bps <= -min_edge_bps:
@@ -46,14 +55,14 @@ def evaluate_signal(
         return None
 
     return Signal(
-        market_id=str(market["id"]),
-        question=str(market["question"]),
+        market_id=market.id,
+        question=market.question,
         action=action,
         market_yes_prob=round(market_yes_prob, 4),
         model_yes_prob=round(float(model_prob), 4),
         edge_bps=edge_bps,
         confidence=round(float(confidence), 4),
-        liquidity=round(liquidity, 2),
+        liquidity=round(market.liquidity, 2),
         rationale=rationale,
     )
 